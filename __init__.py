@@ -3,12 +3,11 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, PLATFORMS
+from .const import PLATFORMS
 from .coordinator import ModbusMappedCoordinator
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
-    hass.data.setdefault(DOMAIN, {})
     return True
 
 
@@ -16,14 +15,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = ModbusMappedCoordinator(hass, entry)
 
     # First refresh loads mapping (in executor) + reads initial values
-    await coordinator.async_config_entry_first_refresh()
-
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except BaseException:
+        # give the pooled client back, or every retry leaks a reference to it
+        await coordinator.async_close()
+        raise
+
+    entry.runtime_data = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    coordinator: ModbusMappedCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+    coordinator: ModbusMappedCoordinator = entry.runtime_data
     await coordinator.async_close()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -1,23 +1,27 @@
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import PLATFORM_BINARY_SENSOR
 from .coordinator import ModbusMappedCoordinator, MappedEntity
+from .entity import MappedValueEntity, _as_bool
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
-    coordinator: ModbusMappedCoordinator = hass.data[DOMAIN][entry.entry_id]
-    ents = [e for e in coordinator.mapping.entities if e.platform == "binary_sensor"]
+    coordinator: ModbusMappedCoordinator = entry.runtime_data
+    ents = coordinator.entities_by_platform.get(PLATFORM_BINARY_SENSOR, ())
     async_add_entities([MappedBinarySensor(coordinator, entry, e) for e in ents])
 
 
-class MappedBinarySensor(CoordinatorEntity[ModbusMappedCoordinator], BinarySensorEntity):
+class MappedBinarySensor(MappedValueEntity, BinarySensorEntity):
+    __slots__ = ("_entry", "_ent")
+
     def __init__(self, coordinator: ModbusMappedCoordinator, entry: ConfigEntry, ent: MappedEntity) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, ent.key)
 
         self._entry = entry
         self._ent = ent
@@ -25,25 +29,18 @@ class MappedBinarySensor(CoordinatorEntity[ModbusMappedCoordinator], BinarySenso
         self._attr_unique_id = f"{entry.entry_id}:{ent.key}"
         self._attr_name = ent.name
 
-        icon = getattr(ent, "icon", None)
-        if icon:
-            self._attr_icon = icon
+        if ent.icon:
+            self._attr_icon = ent.icon
+
+        if ent.device_class:
+            self._attr_device_class = ent.device_class
 
-        device_class = getattr(ent, "device_class", None)
-        if device_class:
-            self._attr_device_class = device_class
+        if ent.description:
+            self._attr_entity_description = ent.description
 
-        description = getattr(ent, "description", None)
-        if description:
-            self._attr_entity_description = description
+        self._attr_extra_state_attributes = ent.attributes
 
-        self._attr_extra_state_attributes = {"key": ent.key}
-        if description:
-            self._attr_extra_state_attributes["description"] = description
+        self._apply(coordinator.data.get(self._key))
 
-    @property
-    def is_on(self) -> bool | None:
-        v = self.coordinator.data.get(self._ent.key)
-        if v is None:
-            return None
-        return bool(v)
+    def _apply(self, v: Any) -> None:
+        self._attr_is_on = _as_bool(v)
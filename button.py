@@ -2,20 +2,24 @@ from __future__ import annotations
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import PLATFORM_BUTTON
 from .coordinator import ModbusMappedCoordinator, MappedEntity
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
-    coordinator: ModbusMappedCoordinator = hass.data[DOMAIN][entry.entry_id]
-    ents = [e for e in coordinator.mapping.entities if e.platform == "button"]
+    coordinator: ModbusMappedCoordinator = entry.runtime_data
+    ents = coordinator.entities_by_platform.get(PLATFORM_BUTTON, ())
     async_add_entities([MappedButton(coordinator, entry, e) for e in ents])
 
 
 class MappedButton(CoordinatorEntity[ModbusMappedCoordinator], ButtonEntity):
+    # HA entity bases still carry a __dict__ (for the _attr_* fields); slots only
+    # cover the attributes added here.
+    __slots__ = ("_entry", "_ent", "_press_value", "_writable", "_last_available")
+
     def __init__(self, coordinator: ModbusMappedCoordinator, entry: ConfigEntry, ent: MappedEntity) -> None:
         super().__init__(coordinator)
 
@@ -25,23 +29,30 @@ class MappedButton(CoordinatorEntity[ModbusMappedCoordinator], ButtonEntity):
         self._attr_unique_id = f"{entry.entry_id}:{ent.key}"
         self._attr_name = ent.name
 
-        icon = getattr(ent, "icon", None)
-        if icon:
-            self._attr_icon = icon
+        if ent.icon:
+            self._attr_icon = ent.icon
+
+        if ent.description:
+            self._attr_entity_description = ent.description
 
-        description = getattr(ent, "description", None)
-        if description:
-            self._attr_entity_description = description
+        self._press_value = ent.press_value
+        self._writable = bool(ent.write)
 
-        self._press_value = getattr(ent, "press_value", None)
-        if self._press_value is None:
-            self._press_value = 1
+        self._attr_extra_state_attributes = ent.attributes
 
-        self._attr_extra_state_attributes = {"key": ent.key}
-        if description:
-            self._attr_extra_state_attributes["description"] = description
+        self._last_available: bool | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # A button has no polled state; only availability can change with a
+        # coordinator update, so skip the state write on every other tick.
+        available = self.available
+        if available == self._last_available:
+            return
+        self._last_available = available
+        self.async_write_ha_state()
 
     async def async_press(self) -> None:
-        if not getattr(self._ent, "write", None):
+        if not self._writable:
             return
         await self.coordinator.write_holding(self._ent, self._press_value)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -29,27 +30,27 @@ from .coordinator import list_mapping_files
 TRANSPORTS = ["tcp", "rtu"]
 
 
-def _mapping_selector() -> selector.SelectSelector:
-    files = list_mapping_files()
+@lru_cache(maxsize=4)
+def _mapping_selector(files: tuple[str, ...]) -> selector.SelectSelector:
+    # keyed by the file tuple, so a changed mapping directory yields a new selector
     return selector.SelectSelector(
         selector.SelectSelectorConfig(
-            options=files,
+            options=list(files),
             mode=selector.SelectSelectorMode.DROPDOWN,
         )
     )
 
 
-def _scan_interval_selector(default_value: int) -> selector.NumberSelector:
-    # seconds, not minutes
-    return selector.NumberSelector(
-        selector.NumberSelectorConfig(
-            min=1,
-            max=3600,
-            step=1,
-            mode=selector.NumberSelectorMode.BOX,
-            unit_of_measurement="s",
-        )
+# seconds, not minutes; the default lives on the schema key, so one selector serves every form
+_SCAN_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=3600,
+        step=1,
+        mode=selector.NumberSelectorMode.BOX,
+        unit_of_measurement="s",
     )
+)
 
 
 class ModbusMappedDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -87,9 +88,7 @@ class ModbusMappedDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(CONF_PORT, default=DEFAULT_TCP_PORT): int,
                     vol.Required(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): int,
                     # seconds
-                    vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): _scan_interval_selector(
-                        DEFAULT_SCAN_INTERVAL
-                    ),
+                    vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): _SCAN_INTERVAL_SELECTOR,
                 }
             ),
         )
@@ -110,15 +109,13 @@ class ModbusMappedDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(CONF_STOPBITS, default=1): vol.In([1, 2]),
                     vol.Required(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): int,
                     # seconds
-                    vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): _scan_interval_selector(
-                        DEFAULT_SCAN_INTERVAL
-                    ),
+                    vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): _SCAN_INTERVAL_SELECTOR,
                 }
             ),
         )
 
     async def async_step_mapping(self, user_input=None):
-        files = list_mapping_files()
+        files = await self.hass.async_add_executor_job(list_mapping_files)
 
         if not files:
             return self.async_abort(reason="no_mapping_files")
@@ -134,14 +131,14 @@ class ModbusMappedDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="mapping",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_MAPPING): _mapping_selector(),
+                    vol.Required(CONF_MAPPING): _mapping_selector(tuple(files)),
                 }
             ),
         )
 
     async def async_step_options(self, user_input=None):
         entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
-        files = list_mapping_files()
+        files = await self.hass.async_add_executor_job(list_mapping_files)
 
         if not files:
             return self.async_abort(reason="no_mapping_files")
@@ -157,8 +154,8 @@ class ModbusMappedDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_SCAN_INTERVAL,
                         default=entry.data[CONF_SCAN_INTERVAL],
-                    ): _scan_interval_selector(int(entry.data[CONF_SCAN_INTERVAL])),
-                    vol.Required(CONF_MAPPING, default=entry.data[CONF_MAPPING]): _mapping_selector(),
+                    ): _SCAN_INTERVAL_SELECTOR,
+                    vol.Required(CONF_MAPPING, default=entry.data[CONF_MAPPING]): _mapping_selector(tuple(files)),
                 }
             ),
         )
@@ -1,13 +1,20 @@
 DOMAIN = "modbus_mapped_device"
 
-PLATFORMS = [
-    "sensor",
-    "binary_sensor",
-    "number",
-    "switch",
-    "select",
-    "button",
-]
+PLATFORM_SENSOR = "sensor"
+PLATFORM_BINARY_SENSOR = "binary_sensor"
+PLATFORM_NUMBER = "number"
+PLATFORM_SWITCH = "switch"
+PLATFORM_SELECT = "select"
+PLATFORM_BUTTON = "button"
+
+PLATFORMS = (
+    PLATFORM_SENSOR,
+    PLATFORM_BINARY_SENSOR,
+    PLATFORM_NUMBER,
+    PLATFORM_SWITCH,
+    PLATFORM_SELECT,
+    PLATFORM_BUTTON,
+)
 
 CONF_TRANSPORT = "transport"
 CONF_MAPPING = "mapping_file"
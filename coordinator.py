@@ -3,14 +3,26 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import stat
 import struct
-from dataclasses import dataclass
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import timedelta
-from types import SimpleNamespace
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple
 
+import yaml
+from pymodbus.exceptions import ConnectionException
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.util import yaml as ha_yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
 from .const import *
 from .modbus_client import ModbusClientWrapper, TcpParams, RtuParams
@@ -20,9 +32,32 @@ _LOGGER = logging.getLogger(__name__)
 # Safety limits for Modbus batch reads (keep conservative for RTU)
 MAX_REGS_PER_READ = 60          # holding/input registers
 MAX_BITS_PER_READ = 200         # coils/discrete bits
+# Unmapped registers a batch may bridge; ranges the device refuses are split again at runtime
+MAX_REGS_GAP = 8
+# How long a polled holding register may stand in for the read of a bit write's read-modify-write
+SHADOW_MAX_AGE = 5.0  # seconds
+# How fresh a successful poll (counted from its start) must be for a write of the value it returned to be skipped
+UNCHANGED_MAX_AGE = 5.0  # seconds
+# Modbus exception code for a request touching addresses the device doesn't serve
+ILLEGAL_DATA_ADDRESS = 2
+# Protocol ceilings for per-device overrides (device.max_regs_per_read / max_bits_per_read)
+MODBUS_MAX_REGS = 125
+MODBUS_MAX_BITS = 2000
+
+
+def _device_limit(device: dict, name: str, default: int, lo: int, hi: int) -> int:
+    """Reads an optional integer tuning knob from the mapping's device block, clamped to lo..hi."""
+    value = device.get(name)
+    if value is None:
+        return default
+    try:
+        return min(max(int(value), lo), hi)
+    except (TypeError, ValueError):
+        _LOGGER.warning("Ignoring device.%s=%r (not an integer), using %d", name, value, default)
+        return default
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MappedEntity:
     platform: str
     key: str
@@ -42,7 +77,10 @@ class MappedEntity:
 
     options: list | None = None
     step: float | None = None
-    press_value: int | None = None
+    press_value: int = 1
+
+    # Read-only extra state attributes ({"key", "minimum", "maximum", "description"}), built once at load time
+    attributes: Mapping[str, Any] = field(default_factory=dict, repr=False, compare=False)
 
 
 def _base_dir() -> str:
@@ -53,43 +91,50 @@ def _mappings_dir() -> str:
     return os.path.join(_base_dir(), "mappings")
 
 
-def list_mapping_files() -> list[str]:
-    mdir = _mappings_dir()
-    if not os.path.isdir(mdir):
-        return []
-    files: list[str] = []
-    for f in os.listdir(mdir):
-        fl = f.lower()
-        if fl.endswith(".yaml") or fl.endswith(".yml"):
-            files.append(f)
-    files.sort()
-    return files
+_MAPPING_SUFFIXES = (".yaml", ".yml")
 
 
-def _require_dict(value: Any) -> bool:
-    return isinstance(value, dict)
+@lru_cache(maxsize=4)
+def _cached_list_mapping_files(mdir: str, mtime_ns: int) -> tuple[str, ...]:
+    # mtime_ns is only part of the cache key: adding/removing a file bumps the
+    # directory mtime and therefore invalidates the cached listing.
+    files: list[str] = []
+    with os.scandir(mdir) as it:
+        for entry in it:
+            # is_file() uses the d_type from the directory read (stat only for symlinks)
+            if entry.name.lower().endswith(_MAPPING_SUFFIXES) and entry.is_file():
+                files.append(entry.name)
+    files.sort()
+    return tuple(files)
 
 
-def _require_list(value: Any) -> bool:
-    return isinstance(value, list)
+def list_mapping_files() -> list[str]:
+    mdir = _mappings_dir()
+    try:
+        st = os.stat(mdir)
+    except OSError:
+        return []
+    if not stat.S_ISDIR(st.st_mode):
+        return []
+    return list(_cached_list_mapping_files(mdir, st.st_mtime_ns))
 
 
 def _parse_mapping_data(filename: str, data: Any) -> tuple[dict, list[MappedEntity]]:
     # Minimal parsing (assuming your validation layer exists already);
     # keep backwards-compat min/max.
-    if not _require_dict(data):
+    if not isinstance(data, dict):
         raise ValueError(f"{filename}: root must be a mapping/dict")
 
     device = data.get("device")
     entities_raw = data.get("entities")
-    if not _require_dict(device):
+    if not isinstance(device, dict):
         raise ValueError(f"{filename}: device must be a mapping/dict")
-    if not _require_list(entities_raw):
+    if not isinstance(entities_raw, list):
         raise ValueError(f"{filename}: entities must be a list")
 
     entities: list[MappedEntity] = []
     for e in entities_raw:
-        if not _require_dict(e):
+        if not isinstance(e, dict):
             continue
 
         minimum = e.get("minimum")
@@ -99,9 +144,25 @@ def _parse_mapping_data(filename: str, data: Any) -> tuple[dict, list[MappedEnti
         if maximum is None and "max" in e:
             maximum = e.get("max")
 
+        # interned: the same string object keys coordinator.data and every entity's lookup
+        key = sys.intern(str(e.get("key")))
+        # interned so it is identical to the PLATFORM_* constants
+        platform = sys.intern(str(e.get("platform")))
+        minimum = float(minimum) if minimum is not None else None
+        maximum = float(maximum) if maximum is not None else None
+        description = e.get("description")
+        attributes: dict[str, Any] = {"key": key}
+        if platform in (PLATFORM_SENSOR, PLATFORM_NUMBER):
+            if minimum is not None:
+                attributes["minimum"] = minimum
+            if maximum is not None:
+                attributes["maximum"] = maximum
+        if description:
+            attributes["description"] = description
+
         ent = MappedEntity(
-            platform=str(e.get("platform")),
-            key=str(e.get("key")),
+            platform=platform,
+            key=key,
             name=str(e.get("name", e.get("key"))),
             read=e.get("read"),
             write=e.get("write"),
@@ -109,58 +170,265 @@ def _parse_mapping_data(filename: str, data: Any) -> tuple[dict, list[MappedEnti
             icon=e.get("icon"),
             device_class=e.get("device_class"),
             state_class=e.get("state_class"),
-            description=e.get("description"),
-            minimum=float(minimum) if minimum is not None else None,
-            maximum=float(maximum) if maximum is not None else None,
+            description=description,
+            minimum=minimum,
+            maximum=maximum,
             options=e.get("options"),
             step=float(e["step"]) if e.get("step") is not None else None,
-            press_value=e.get("press_value"),
+            press_value=e["press_value"] if e.get("press_value") is not None else 1,
+            attributes=MappingProxyType(attributes),
         )
         entities.append(ent)
 
     return device, entities
 
 
+# Process-wide LRU of parsed mappings: (path, mtime_ns, size) -> (device, entities)
+MAPPING_CACHE_SIZE = 64
+_MAPPING_CACHE: OrderedDict[tuple[str, int, int], tuple[dict, tuple[MappedEntity, ...]]] = OrderedDict()
+_MAPPING_CACHE_LOCK = threading.Lock()  # loads run in executor threads
+
+
 def load_mapping_sync(filename: str) -> tuple[dict, list[MappedEntity]]:
     path = os.path.join(_mappings_dir(), filename)
-    if not os.path.exists(path):
-        raise ValueError(f"Mapping-Datei nicht gefunden: {path}")
+    # The stat doubles as the existence check
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise ValueError(f"Mapping-Datei nicht gefunden: {path}") from None
+
+    # Reuse the parsed result while the file is unchanged (MappedEntity is frozen)
+    cache_key = (path, st.st_mtime_ns, st.st_size)
+    with _MAPPING_CACHE_LOCK:
+        cached = _MAPPING_CACHE.get(cache_key)
+        if cached is not None:
+            _MAPPING_CACHE.move_to_end(cache_key)
+    if cached is not None:
+        return cached[0], list(cached[1])
 
     try:
-        data = ha_yaml.load_yaml(path)
+        # Fast path: libyaml-backed loader on the raw bytes, read in one go
+        with open(path, "rb") as fh:
+            raw = fh.read()
+        data = yaml.load(raw, Loader=_YamlLoader)
+    except yaml.YAMLError:
+        # Slow path: HA's loader supports its custom tags and gives annotated errors
+        from homeassistant.util import yaml as ha_yaml  # only needed for this fallback
+
+        try:
+            data = ha_yaml.load_yaml(path)
+        except Exception as ex:
+            raise ValueError(f"{filename}: YAML parse error: {ex}") from ex
     except Exception as ex:
         raise ValueError(f"{filename}: YAML parse error: {ex}") from ex
 
-    return _parse_mapping_data(filename, data)
+    device, entities = _parse_mapping_data(filename, data)
+    with _MAPPING_CACHE_LOCK:
+        _MAPPING_CACHE[cache_key] = (device, tuple(entities))
+        while len(_MAPPING_CACHE) > MAPPING_CACHE_SIZE:
+            _MAPPING_CACHE.popitem(last=False)
+    return device, entities
+
+
+@dataclass(slots=True, frozen=True)
+class DeviceMapping:
+    """Snapshot of a loaded mapping; replaced as a whole on (re)load."""
+    entities: tuple[MappedEntity, ...] = ()
+    device_name: str = "Modbus Device"
+    manufacturer: str | None = None
+    model: str | None = None
+
+
+RegDecoder = Callable[[list[int], int], Any]
 
+# float32 needs the IEEE-754 repack; the integer types are sign-extended with xor/subtract
+_HH = struct.Struct(">HH")
+_F32 = struct.Struct(">f")
 
-def _decode_16_32(dtype: str, regs: list[int], word_order: str) -> int | float:
-    regs = [int(r) & 0xFFFF for r in regs]
 
-    if word_order == "BA" and len(regs) == 2:
-        regs = [regs[1], regs[0]]
+def _decode_uint16(regs: list[int], off: int) -> int:
+    return regs[off] & 0xFFFF
 
-    if dtype == "uint16":
-        return regs[0]
-    if dtype == "int16":
-        return struct.unpack(">h", struct.pack(">H", regs[0]))[0]
 
-    raw = ((regs[0] << 16) | regs[1]) & 0xFFFFFFFF
+def _decode_int16(regs: list[int], off: int) -> int:
+    return ((regs[off] & 0xFFFF) ^ 0x8000) - 0x8000
+
+
+@lru_cache(maxsize=32)
+def _value_decoder(dtype: str, word_order: str) -> RegDecoder:
+    """
+    Returns decode(regs, offset) for a raw (unscaled) uint16/int16/uint32/int32/float32 value.
+    Cached, so all entities with the same (dtype, word_order) share one callable.
+    """
+    if not dtype.endswith("32"):
+        return _decode_int16 if dtype == "int16" else _decode_uint16
+
+    # index of the high word relative to off
+    hi, lo = (1, 0) if word_order == "BA" else (0, 1)
     if dtype == "uint32":
-        return raw
+        return lambda regs, off: ((regs[off + hi] & 0xFFFF) << 16) | (regs[off + lo] & 0xFFFF)
     if dtype == "int32":
-        return struct.unpack(">i", struct.pack(">I", raw))[0]
+        return lambda regs, off: ((((regs[off + hi] & 0xFFFF) << 16) | (regs[off + lo] & 0xFFFF)) ^ 0x80000000) - 0x80000000
     if dtype == "float32":
-        return struct.unpack(">f", struct.pack(">I", raw))[0]
+        return lambda regs, off: _F32.unpack(_HH.pack(regs[off + hi] & 0xFFFF, regs[off + lo] & 0xFFFF))[0]
+    return lambda regs, off: regs[off + hi] & 0xFFFF
+
+
+def _make_decoder(dtype: str, word_order: str, scale: float | None, bit: int | None) -> RegDecoder:
+    """
+    Binds one entity's read spec into decode(regs, offset), so the update cycle
+    does no per-value dispatch on bit/scale.
+    """
+    if bit is not None:
+        mask = 1 << bit
+        return lambda regs, off: bool(regs[off] & mask)
+    decode = _value_decoder(dtype, word_order)
+    if scale is None:
+        return decode
+    # scale is already a float, so the product is one as well
+    return lambda regs, off: decode(regs, off) * scale
+
+
+def _encode_registers(dtype: str, word_order: str, value: float | int) -> list[int]:
+    """Encodes one value into the register words to write (inverse of _value_decoder)."""
+    if dtype == "float32":
+        hi, lo = _HH.unpack(_F32.pack(float(value)))
+    else:
+        iv = int(round(value))
+        if not dtype.endswith("32"):
+            # accept both signed and unsigned notation; the device sees the same 16 bits
+            if not -0x8000 <= iv <= 0xFFFF:
+                raise ValueError(f"Wert {iv} passt nicht in 16 Bit ({dtype})")
+            return [iv & 0xFFFF]
+        if not -0x80000000 <= iv <= 0xFFFFFFFF:
+            raise ValueError(f"Wert {iv} passt nicht in 32 Bit ({dtype})")
+        hi, lo = (iv >> 16) & 0xFFFF, iv & 0xFFFF
+    return [lo, hi] if word_order == "BA" else [hi, lo]
+
+
+class _WriteSpec(NamedTuple):
+    """Parsed write: block of one writable entity; built once per mapping load."""
+    addr: int
+    mask: int | None        # holding-bit switch: 1 << bit
+    dtype: str
+    word_order: str
+    scale: float | None     # UI value is divided by this before writing (None: unscaled)
+    verify: bool
+    optimistic: bool        # read decodes exactly this target, so the written value can be shown right away
+    skip_unchanged: bool    # polled value is this very register: a write of the same value is a no-op
+
+
+def _read_mirrors_write(ent: MappedEntity) -> bool:
+    """
+    True if the entity's read: decodes exactly what its write: sends (same holding
+    register, bit, data_type, word_order and scale); only then does the written value
+    say anything about what the next poll will return.
+    """
+    r, w = ent.read, ent.write
+    if not isinstance(r, dict) or not isinstance(w, dict):
+        return False
+    if str(r.get("type", "holding")) != "holding":
+        return False
+    try:
+        if int(r["address"]) != int(w["address"]):
+            return False
+        r_bit = int(r["bit"]) if r.get("bit") is not None else None
+        w_bit = int(w["bit"]) if w.get("bit") is not None else None
+        r_scale = float(r["scale"]) if r.get("scale") is not None else None
+        w_scale = float(w["scale"]) if w.get("scale") is not None else None
+    except (KeyError, TypeError, ValueError):
+        return False
+    if r_bit != w_bit:
+        return False
+    if r_bit is not None:
+        # both sides are the same single bit; data_type/scale don't apply
+        return True
+    r_dtype = str(r.get("data_type", "uint16"))
+    r_order = str(r.get("word_order", "AB"))
+    return (
+        str(w.get("data_type", r_dtype)) == r_dtype
+        and str(w.get("word_order", r_order)) == r_order
+        # 1 means unscaled on both sides (and so does 0 on the write side, see _make_write_spec)
+        and (r_scale if r_scale not in (None, 1.0) else None)
+        == (w_scale if w_scale not in (None, 0.0, 1.0) else None)
+    )
+
+
+def _make_write_spec(ent: MappedEntity) -> _WriteSpec:
+    w = ent.write
+    w_type = str(w.get("type", "holding"))
+    if w_type != "holding":
+        raise UpdateFailed(f"write.type '{w_type}' wird derzeit nicht unterstützt")
+
+    r = ent.read or {}
+    bit = w.get("bit")
+    scale = w.get("scale")
+    scale_f = float(scale) if scale is not None else None
+    return _WriteSpec(
+        addr=int(w["address"]),
+        mask=(1 << int(bit)) if bit is not None else None,
+        dtype=str(w.get("data_type", r.get("data_type", "uint16"))),
+        word_order=str(w.get("word_order", r.get("word_order", "AB"))),
+        scale=scale_f or None,
+        verify=bool(w.get("verify")),
+        optimistic=_read_mirrors_write(ent),
+        # buttons must always fire; verify means the polled value is not trusted
+        skip_unchanged=ent.platform != "button" and not w.get("verify") and _read_mirrors_write(ent),
+    )
+
+
+def _is_unchanged(spec: _WriteSpec, ent: MappedEntity, cur: Any, value: Any) -> bool:
+    if cur is None:
+        return False
+    if spec.mask is not None:
+        return bool(cur) == bool(value)
+    try:
+        return abs(float(cur) - float(value)) <= (ent.step or 0) / 2
+    except (TypeError, ValueError):
+        return False
 
-    return regs[0]
+
+class _RegRead(NamedTuple):
+    """One entity's slot in a batched register read (key first: it is all the hot loop needs besides decode)."""
+    key: str
+    addr: int
+    width: int
+    dtype: str
+    decode: RegDecoder
+    ent: MappedEntity
+
+
+class _BitRead(NamedTuple):
+    """One entity's slot in a batched coil/discrete read."""
+    key: str
+    addr: int
+    ent: MappedEntity
+
+
+# Errors that mean the link itself is gone: abort the cycle instead of
+# letting every remaining batch/fallback read run into the same timeout.
+_TRANSPORT_ERRORS = (ConnectionException, OSError, asyncio.TimeoutError)
+
+
+class _SkippedRead(RuntimeError):
+    """Fallback read not attempted: the address is backing off after repeated failures."""
+
+
+class _ModbusErrorResponse(RuntimeError):
+    """
+    The client returned an error response instead of data. exception_code is the Modbus
+    exception code for real exception responses (2 = illegal data address) and None for
+    anything else (timeouts returned as ModbusIOException, empty responses, ...).
+    """
+
+    def __init__(self, rr: Any) -> None:
+        super().__init__(f"Modbus error response: {rr}")
+        self.exception_code: int | None = getattr(rr, "exception_code", None)
 
 
 def _rr_is_error(rr: Any) -> bool:
-    try:
-        return bool(rr.isError())
-    except Exception:
-        return False
+    # every pymodbus response (incl. ExceptionResponse) implements isError(); None means no response
+    return rr is None or rr.isError()
 
 
 class ModbusMappedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -168,21 +436,41 @@ class ModbusMappedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.hass = hass
         self.entry = entry
 
-        self._lock = asyncio.Lock()
+        # Polls and writes are serialised separately; the wire itself is guarded by the client's I/O lock,
+        # so a write only waits for the request in flight, not for a whole poll cycle.
+        self._poll_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        # Bumped by every completed write; a poll that overlapped one doesn't publish the written keys
+        self._write_gen = 0
+        self._written_gen: dict[str, int] = {}
+        # A write asked for a read-back while a cycle was running: run one more right after it
+        self._readback_pending = False
         self._connected = False
 
         self._mapping_file = entry.data[CONF_MAPPING]
         self._mapping_loaded = False
 
         self.device: dict = {}
-        self.entities: list[MappedEntity] = []
-
-        self.mapping = SimpleNamespace(
-            entities=self.entities,
-            device_name="Modbus Device",
-            manufacturer=None,
-            model=None,
-        )
+        self.entities_by_platform: dict[str, list[MappedEntity]] = {}
+
+        # Read plan, built once per mapping load: reg_type -> [(start, end, payloads)]
+        self._reg_plan: dict[str, list[tuple[int, int, list[_RegRead]]]] = {}
+        self._bit_plan: dict[str, list[tuple[int, int, list[_BitRead]]]] = {}
+        # Every planned key pre-set to None; copied per cycle so the result dict is sized once
+        self._data_template: dict[str, Any] = {}
+        self._write_specs: dict[str, _WriteSpec] = {}
+        self._max_regs = MAX_REGS_PER_READ
+        # Fallback backoff: (reg_type, addr) -> (cycles left to skip, current penalty)
+        self._bad_reads: dict[tuple[str, int], tuple[int, int]] = {}
+        # Last seen value of holding registers targeted by bit writes: addr -> (value, monotonic ts)
+        self._shadow_addrs: frozenset[int] = frozenset()
+        self._reg_shadow: dict[int, tuple[int, float]] = {}
+        # monotonic time the last fully successful poll *started* (None: the last one failed),
+        # and of the last completed write: self.data only proves a value if it was read after that write
+        self._data_ok_at: float | None = None
+        self._last_write_at = 0.0
+
+        self.mapping = DeviceMapping()
 
         self._slave = int(entry.data[CONF_SLAVE_ID])
 
@@ -199,28 +487,46 @@ class ModbusMappedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 int(entry.data[CONF_STOPBITS]),
             )
 
-        self.client = ModbusClientWrapper(transport, tcp, rtu)
+        self.client = ModbusClientWrapper.acquire(transport, tcp, rtu)
 
         super().__init__(
             hass,
             logger=_LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=int(entry.data[CONF_SCAN_INTERVAL])),
+            # every poll returns a fresh dict, so an unchanged poll compares equal and
+            # entity listeners are not called at all
+            always_update=False,
         )
 
+    @property
+    def entities(self) -> tuple[MappedEntity, ...]:
+        """Entities of the currently loaded mapping (single source: self.mapping)."""
+        return self.mapping.entities
+
+    def _submit(self, fn: Callable[..., Any], *args: Any, write: bool = False) -> asyncio.Future:
+        """Runs a blocking client call on the client's own worker threads (writes on their dedicated one)."""
+        executor = self.client.write_executor if write else self.client.executor
+        return self.hass.loop.run_in_executor(executor, fn, *args)
+
     async def async_close(self) -> None:
-        await self.hass.async_add_executor_job(self.client.close)
+        if not self.client.release():
+            # Other entries still poll this endpoint; leave the connection open for them
+            return
+        await self._submit(self.client.close)
+        self.client.shutdown()
 
-    async def _ensure(self) -> None:
-        if self._connected:
+    async def _ensure(self, write: bool = False) -> None:
+        # pymodbus closes the socket itself on some errors; only hop to the executor when it is really gone
+        if self._connected and self.client.connected:
             return
-        ok = await self.hass.async_add_executor_job(self.client.connect)
+        ok = await self._submit(self.client.connect, write=write)
         if not ok:
             raise UpdateFailed("Connect failed")
         self._connected = True
 
-    async def _drop(self) -> None:
-        await self.hass.async_add_executor_job(self.client.close)
+    async def _drop(self, write: bool = False) -> None:
+        await self._submit(self.client.close, write=write)
         self._connected = False
 
     async def _ensure_mapping_loaded(self) -> None:
@@ -232,34 +538,91 @@ class ModbusMappedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise UpdateFailed(str(ex)) from ex
 
         self.device = device
-        self.entities = entities
 
-        self.mapping.entities = self.entities
-        self.mapping.device_name = device.get("name", "Modbus Device")
-        self.mapping.manufacturer = device.get("manufacturer")
-        self.mapping.model = device.get("model")
+        # Group once so each platform setup is a single dict lookup
+        by_platform: dict[str, list[MappedEntity]] = {}
+        for ent in entities:
+            by_platform.setdefault(ent.platform, []).append(ent)
+        self.entities_by_platform = by_platform
+
+        self.mapping = DeviceMapping(
+            entities=tuple(entities),
+            device_name=device.get("name", "Modbus Device"),
+            manufacturer=device.get("manufacturer"),
+            model=device.get("model"),
+        )
+
+        self._build_read_plan()
+        self._build_write_specs()
 
         self._mapping_loaded = True
 
     async def _async_update_data(self) -> dict[str, Any]:
-        await self._ensure_mapping_loaded()
-
-        async with self._lock:
+        if self._poll_lock.locked() and self._mapping_loaded:
+            # A (slow) cycle is still running: don't queue a second one behind it
+            # (a read-back a write asked for is not lost: see _request_readback)
+            _LOGGER.debug("Previous update still in progress, skipping this one")
+            return self.data or {}
+
+        async with self._poll_lock:
+            # this cycle reads after every write that asked for a read-back so far
+            self._readback_pending = False
+            write_gen = self._write_gen
             try:
-                await self._ensure()
-                return await self._read_all()
-            except Exception as e:
-                # IMPORTANT: do NOT always drop the connection here.
-                # A single register can fail (timeout/illegal address) without meaning the link is dead.
-                _LOGGER.warning("Update cycle failed (keeping connection): %s", e, exc_info=True)
-
-                # Only drop on obvious transport-level failures
-                if isinstance(e, (OSError, ConnectionError, asyncio.TimeoutError)):
-                    _LOGGER.warning("Transport-level error -> dropping connection to force reconnect")
+                return await self._poll_cycle(write_gen)
+            finally:
+                if self._readback_pending:
+                    # a write finished mid-cycle; what we just read may predate it
+                    self.hass.async_create_task(self.async_refresh())
+
+    def _request_readback(self) -> None:
+        """Re-reads the device after a write, also when a cycle is running right now."""
+        self._readback_pending = True
+        if not self._poll_lock.locked():
+            self.hass.async_create_task(self.async_request_refresh())
+
+    async def _poll_cycle(self, write_gen: int) -> dict[str, Any]:
+        """One update cycle; runs under _poll_lock."""
+        connect_err: BaseException | None = None
+        if not self._mapping_loaded:
+            # Cold start: open the connection while the mapping file is being parsed
+            loaded, connect_err = await asyncio.gather(
+                self._ensure_mapping_loaded(), self._ensure(), return_exceptions=True
+            )
+            if loaded is not None:
+                if connect_err is None and not self.client.shared:
+                    # the mapping is broken: don't leave the port we just opened occupied
+                    # (a pooled connection other entries are using stays open for them)
                     await self._drop()
+                raise loaded
 
-                # Return last known data (keeps entities alive), or empty dict if none yet
-                return self.data or {}
+        try:
+            if connect_err is not None:
+                raise connect_err
+            await self._ensure()
+            started = time.monotonic()
+            data = await self._read_all()
+            if self._write_gen != write_gen and self.data:
+                # a write landed while this cycle was reading: its keys may hold the
+                # pre-write value, keep what the write published instead
+                for key, gen in self._written_gen.items():
+                    if gen > write_gen and key in data:
+                        data[key] = self.data.get(key)
+            self._data_ok_at = started
+            return data
+        except Exception as e:
+            self._data_ok_at = None
+            # IMPORTANT: do NOT always drop the connection here.
+            # A single register can fail (timeout/illegal address) without meaning the link is dead.
+            _LOGGER.warning("Update cycle failed (keeping connection): %s", e, exc_info=True)
+
+            # Only drop on obvious transport-level failures
+            if isinstance(e, _TRANSPORT_ERRORS):
+                _LOGGER.warning("Transport-level error -> dropping connection to force reconnect")
+                await self._drop()
+
+            # Return last known data (keeps entities alive), or empty dict if none yet
+            return self.data or {}
 
 
     # ---------------------------------------------------------------------
@@ -275,7 +638,7 @@ class ModbusMappedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         out: list[tuple[MappedEntity, str, int, str, str, float | None, int | None, int]] = []
         for ent in self.entities:
             r = ent.read
-            if not r or not _require_dict(r):
+            if not isinstance(r, dict) or not r:
                 continue
 
             reg_type = str(r.get("type", "holding"))
@@ -300,16 +663,22 @@ class ModbusMappedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 bit_i = int(bit) if bit is not None else None
             except Exception:
                 bit_i = None
+            if bit_i is not None and not 0 <= bit_i <= 15:
+                _LOGGER.warning("Ignoring %s (key=%s): bit %d out of range 0..15", ent.platform, ent.key, bit_i)
+                continue
 
             width = 2 if dtype.endswith("32") else 1
             out.append((ent, reg_type, addr, dtype, word_order, scale_f, bit_i, width))
         return out
 
     @staticmethod
-    def _group_ranges(items: list[tuple[int, int, Any]], max_span: int) -> list[tuple[int, int, list[Any]]]:
+    def _group_ranges(
+        items: list[tuple[int, int, Any]], max_span: int, max_gap: int = 0
+    ) -> list[tuple[int, int, list[Any]]]:
         """
         items: list of (start, end, payload), inclusive end.
         Groups overlapping/adjacent items into ranges, limited by max_span.
+        Items separated by up to max_gap unused addresses are merged too.
         Returns list of (range_start, range_end, payloads)
         """
         if not items:
@@ -324,7 +693,7 @@ class ModbusMappedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             new_e = max(cur_e, e)
             span = new_e - new_s + 1
 
-            if s <= cur_e + 1 and span <= max_span:
+            if s <= cur_e + 1 + max_gap and span <= max_span:
                 cur_e = new_e
                 cur_payloads.append(payload)
             else:
@@ -334,137 +703,270 @@ class ModbusMappedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         groups.append((cur_s, cur_e, cur_payloads))
         return groups
 
-    async def _read_all(self) -> dict[str, Any]:
-        data: dict[str, Any] = {}
-
+    def _build_read_plan(self) -> None:
+        """
+        Groups all readable entities into batch read ranges once per mapping load,
+        so the update cycle only iterates the precomputed ranges.
+        """
         specs = self._iter_reg_entities()
 
-        # Separate by type
-        reg_specs = [s for s in specs if s[1] in ("holding", "input")]
-        bit_specs = [s for s in specs if s[1] in ("coil", "discrete")]
+        # Per-device tuning from the mapping, defaulting to the conservative module limits
+        max_regs = _device_limit(self.device, "max_regs_per_read", MAX_REGS_PER_READ, 1, MODBUS_MAX_REGS)
+        max_gap = _device_limit(self.device, "max_read_gap", MAX_REGS_GAP, 0, MODBUS_MAX_REGS)
+        max_bits = _device_limit(self.device, "max_bits_per_read", MAX_BITS_PER_READ, 1, MODBUS_MAX_BITS)
+        self._max_regs = max_regs
 
-        # ----------- batch holding/input registers -----------
-        # We batch by (reg_type) only; per-entity dtype/scale/word_order are handled when decoding slices.
+        # ----------- holding/input registers -----------
+        # We batch by (reg_type) only; per-entity dtype/scale/word_order/bit are bound into its decoder.
+        reg_plan: dict[str, list[tuple[int, int, list[_RegRead]]]] = {}
         for reg_type in ("holding", "input"):
-            items: list[tuple[int, int, tuple]] = []
-            for ent, rt, addr, dtype, word_order, scale, bit, width in reg_specs:
+            items: list[tuple[int, int, _RegRead]] = []
+            for ent, rt, addr, dtype, word_order, scale, bit, width in specs:
                 if rt != reg_type:
                     continue
                 start = addr
                 end = addr + width - 1
-                items.append((start, end, (ent, addr, dtype, word_order, scale, bit, width)))
+                op = _RegRead(ent.key, addr, width, dtype, _make_decoder(dtype, word_order, scale, bit), ent)
+                items.append((start, end, op))
+            reg_plan[reg_type] = self._group_ranges(items, max_regs, max_gap)
 
-            for start, end, payloads in self._group_ranges(items, MAX_REGS_PER_READ):
-                count = end - start + 1
+        # ----------- coils/discrete bits -----------
+        bit_plan: dict[str, list[tuple[int, int, list[_BitRead]]]] = {}
+        for reg_type in ("coil", "discrete"):
+            items_bits: list[tuple[int, int, _BitRead]] = []
+            for ent, rt, addr, dtype, word_order, scale, bit, width in specs:
+                if rt != reg_type:
+                    continue
+                # coils/discrete are bit-addressed; width is irrelevant here.
+                items_bits.append((addr, addr, _BitRead(ent.key, addr, ent)))
+            bit_plan[reg_type] = self._group_ranges(items_bits, max_bits)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            needed = sum(p.width for groups in reg_plan.values() for _, _, payloads in groups for p in payloads)
+            read = sum(e - s + 1 for groups in reg_plan.values() for s, e, _ in groups)
+            _LOGGER.debug(
+                "Read plan: %d register request(s) covering %d registers (%d for entities, incl. overlaps), "
+                "%d bit request(s); max_regs_per_read=%d max_read_gap=%d",
+                sum(len(g) for g in reg_plan.values()), read, needed,
+                sum(len(g) for g in bit_plan.values()), max_regs, max_gap,
+            )
 
-                # 1) Try batch read
-                rr = None
-                batch_ok = False
-                try:
-                    if reg_type == "holding":
-                        rr = await self.hass.async_add_executor_job(
-                            self.client.read_holding_registers, start, count, self._slave
-                        )
-                    else:
-                        rr = await self.hass.async_add_executor_job(
-                            self.client.read_input_registers, start, count, self._slave
-                        )
+        self._reg_plan = reg_plan
+        self._bit_plan = bit_plan
+        self._data_template = dict.fromkeys(spec[0].key for spec in specs)
+        self._bad_reads = {}
 
-                    if _rr_is_error(rr):
-                        raise RuntimeError(f"Modbus error response: {rr}")
-                    batch_ok = True
+    def _build_write_specs(self) -> None:
+        """Parses every write: block once; broken ones are left out and fail with their error on write."""
+        specs: dict[str, _WriteSpec] = {}
+        for ent in self.entities:
+            if not ent.write:
+                continue
+            try:
+                specs[ent.key] = _make_write_spec(ent)
+            except Exception:
+                continue
+        self._write_specs = specs
+        self._shadow_addrs = frozenset(spec.addr for spec in specs.values() if spec.mask is not None)
+        self._reg_shadow = {}
 
-                except Exception as ex:
-                    _LOGGER.warning(
-                        "Batch read failed (%s %d..%d, count=%d, slave=%d): %s",
-                        reg_type, start, end, count, self._slave, ex,
-                    )
+    def _read_reg_batch(
+        self, reg_type: str, start: int, end: int, payloads: list[_RegRead], data: dict[str, Any]
+    ) -> Exception | None:
+        """
+        Reads one register range and decodes all payloads from it.
+        Returns None on success, or the exception that made the batch read fail.
+        """
+        count = end - start + 1
+        try:
+            if reg_type == "holding":
+                rr = self.client.read_holding_registers(start, count, self._slave)
+            else:
+                rr = self.client.read_input_registers(start, count, self._slave)
 
-                if batch_ok and rr is not None:
-                    regs = rr.registers
-                    # decode each entity from slice
-                    for (ent, addr, dtype, word_order, scale, bit, width) in payloads:
-                        off = addr - start
-                        try:
-                            slice_regs = regs[off:off + width]
-                            if bit is not None:
-                                raw16 = int(slice_regs[0]) & 0xFFFF
-                                val = bool((raw16 >> int(bit)) & 1)
-                            else:
-                                val = _decode_16_32(dtype, slice_regs, word_order)
-                                if scale is not None:
-                                    val = float(val) * float(scale)
-                            data[ent.key] = val
-                        except Exception as ex:
-                            data[ent.key] = None
-                            _LOGGER.warning(
-                                "Decode failed for %s (key=%s, %s addr=%d dtype=%s width=%d): %s",
-                                ent.platform, ent.key, reg_type, addr, dtype, width, ex
-                            )
-                    continue
+            if _rr_is_error(rr):
+                raise _ModbusErrorResponse(rr)
 
-                # 2) Fallback: isolate by reading each entity individually
-                for (ent, addr, dtype, word_order, scale, bit, width) in payloads:
-                    try:
-                        if reg_type == "holding":
-                            rr1 = await self.hass.async_add_executor_job(
-                                self.client.read_holding_registers, addr, width, self._slave
-                            )
-                        else:
-                            rr1 = await self.hass.async_add_executor_job(
-                                self.client.read_input_registers, addr, width, self._slave
-                            )
+        except _TRANSPORT_ERRORS:
+            raise
+        except Exception as ex:
+            _LOGGER.warning(
+                "Batch read failed (%s %d..%d, count=%d, slave=%d): %s",
+                reg_type, start, end, count, self._slave, ex,
+            )
+            return ex
+
+        if self._bad_reads:
+            # the range reads fine again: forget any fallback backoff inside it
+            for p in payloads:
+                self._bad_reads.pop((reg_type, p.addr), None)
+
+        regs = rr.registers
+        if reg_type == "holding" and self._shadow_addrs:
+            now = time.monotonic()
+            # a short response must not cost the whole cycle: only shadow what actually came back
+            last = start + len(regs) - 1
+            for a in self._shadow_addrs:
+                if start <= a <= end and a <= last:
+                    self._reg_shadow[a] = (regs[a - start], now)
+
+        # decode each entity at its offset into the batch
+        for key, addr, width, dtype, decode, ent in payloads:
+            try:
+                data[key] = decode(regs, addr - start)
+            except Exception as ex:
+                data[key] = None
+                _LOGGER.warning(
+                    "Decode failed for %s (key=%s, %s addr=%d dtype=%s width=%d): %s",
+                    ent.platform, key, reg_type, addr, dtype, width, ex
+                )
+        return None
+
+    def _read_fallback(self, reg_type: str, addr: int, count: int) -> Any:
+        """
+        One isolated read for the per-entity fallback; returns the response or the exception.
+        Addresses that keep failing are skipped for 1, 3, 7, ... up to 63 cycles, so a bad
+        register in the mapping doesn't cost a timeout on every poll (while an address is
+        skipped, its batch is read around it, see _read_around_bad).
+        """
+        bad = self._bad_reads.get((reg_type, addr))
+        if bad is not None and bad[0] > 0:
+            self._bad_reads[(reg_type, addr)] = (bad[0] - 1, bad[1])
+            return _SkippedRead(f"skipped for {bad[0]} more cycle(s) after repeated failures")
 
-                        if _rr_is_error(rr1):
-                            raise RuntimeError(f"Modbus error response: {rr1}")
+        try:
+            if reg_type == "holding":
+                rr = self.client.read_holding_registers(addr, count, self._slave)
+            elif reg_type == "input":
+                rr = self.client.read_input_registers(addr, count, self._slave)
+            elif reg_type == "coil":
+                rr = self.client.read_coils(addr, count, self._slave)
+            else:
+                rr = self.client.read_discrete_inputs(addr, count, self._slave)
 
-                        regs1 = rr1.registers
-                        if bit is not None:
-                            raw16 = int(regs1[0]) & 0xFFFF
-                            val = bool((raw16 >> int(bit)) & 1)
-                        else:
-                            val = _decode_16_32(dtype, regs1, word_order)
-                            if scale is not None:
-                                val = float(val) * float(scale)
+            if _rr_is_error(rr):
+                raise RuntimeError(f"Modbus error response: {rr}")
+        except _TRANSPORT_ERRORS:
+            raise
+        except Exception as ex:
+            penalty = min(bad[1] * 2 + 1, 63) if bad is not None else 1
+            self._bad_reads[(reg_type, addr)] = (penalty, penalty)
+            return ex
 
-                        data[ent.key] = val
+        if bad is not None:
+            del self._bad_reads[(reg_type, addr)]
+        return rr
 
-                    except Exception as ex:
-                        data[ent.key] = None
-                        _LOGGER.error(
-                            "Read failed for %s (key=%s, %s addr=%d dtype=%s width=%d slave=%d). "
-                            "Entity will be set to None. Error: %s",
-                            ent.platform, ent.key, reg_type, addr, dtype, width, self._slave, ex
-                        )
+    def _read_reg_single(self, reg_type: str, payloads: list[_RegRead], data: dict[str, Any]) -> None:
+        """
+        Fallback: isolate failures by reading each entity individually.
+        Entities sharing the same register (e.g. bit flags of a status word) share one read.
+        """
+        reads: dict[tuple[int, int], Any] = {}
+        for key, addr, width, dtype, decode, ent in payloads:
+            rr1 = reads.get((addr, width))
+            if rr1 is None:
+                rr1 = reads[(addr, width)] = self._read_fallback(reg_type, addr, width)
+            try:
+                if isinstance(rr1, Exception):
+                    raise rr1
+                data[key] = decode(rr1.registers, 0)
+            except _SkippedRead:
+                data[key] = None
+            except Exception as ex:
+                data[key] = None
+                _LOGGER.error(
+                    "Read failed for %s (key=%s, %s addr=%d dtype=%s width=%d slave=%d). "
+                    "Entity will be set to None. Error: %s",
+                    ent.platform, key, reg_type, addr, dtype, width, self._slave, ex
+                )
+
+    def _read_around_bad(self, reg_type: str, payloads: list[_RegRead], data: dict[str, Any]) -> bool:
+        """
+        If some payloads sit on addresses that are currently skipped by the fallback backoff,
+        reads the others as contiguous runs without them and returns True; else does nothing.
+        The read plan itself is left alone: once the backoff runs out the full range is tried again.
+        """
+        bad = self._bad_reads
+        skipped = [p for p in payloads if bad.get((reg_type, p.addr), (0, 0))[0] > 0]
+        if not skipped:
+            return False
+
+        # counts the skipped ones down and sets them to None
+        self._read_reg_single(reg_type, skipped, data)
+        skipped_keys = {p.key for p in skipped}
+        rest = [(p.addr, p.addr + p.width - 1, p) for p in payloads if p.key not in skipped_keys]
+        for r_start, r_end, r_payloads in self._group_ranges(rest, self._max_regs):
+            if self._read_reg_batch(reg_type, r_start, r_end, r_payloads, data) is not None:
+                self._read_reg_single(reg_type, r_payloads, data)
+        return True
 
-        # ----------- batch coils/discrete bits -----------
-        for reg_type in ("coil", "discrete"):
-            items_bits: list[tuple[int, int, tuple]] = []
-            for ent, rt, addr, dtype, word_order, scale, bit, width in bit_specs:
-                if rt != reg_type:
+    async def _read_all(self) -> dict[str, Any]:
+        # One worker job per cycle: all batches, splits and fallbacks run back to back
+        # in the worker thread instead of hopping through the pool for every request.
+        return await self._submit(self._read_all_sync)
+
+    def _read_all_sync(self) -> dict[str, Any]:
+        """Runs the whole read plan (blocking). Executor only."""
+        data = self._data_template.copy()
+
+        # ----------- batch holding/input registers -----------
+        for reg_type, groups in self._reg_plan.items():
+            for group in list(groups):
+                start, end, payloads = group
+
+                # 0) A register in this range is backing off after repeated failures: read the
+                #    rest around it instead of re-issuing the batch that keeps failing (and timing out)
+                if self._bad_reads and self._read_around_bad(reg_type, payloads, data):
+                    continue
+
+                # 1) Try batch read
+                err = self._read_reg_batch(reg_type, start, end, payloads, data)
+                if err is None:
                     continue
-                # coils/discrete are bit-addressed; width is irrelevant here.
-                items_bits.append((addr, addr, (ent, addr)))
 
-            for start, end, payloads in self._group_ranges(items_bits, MAX_BITS_PER_READ):
+                # 2) The device rejected a range that bridges unmapped registers (illegal data
+                #    address): stop bridging for this range and read its contiguous runs instead.
+                #    Timeouts, busy or gateway errors say nothing about the gaps; they only go
+                #    to the per-entity fallback for this cycle and leave the plan alone.
+                if isinstance(err, _ModbusErrorResponse) and err.exception_code == ILLEGAL_DATA_ADDRESS:
+                    runs = self._group_ranges(
+                        [(p.addr, p.addr + p.width - 1, p) for p in payloads], self._max_regs
+                    )
+                    if len(runs) > 1:
+                        _LOGGER.info(
+                            "Splitting %s range %d..%d into %d contiguous reads (gaps not readable)",
+                            reg_type, start, end, len(runs),
+                        )
+                        idx = groups.index(group)
+                        groups[idx:idx + 1] = runs
+                        for r_start, r_end, r_payloads in runs:
+                            if self._read_reg_batch(reg_type, r_start, r_end, r_payloads, data) is not None:
+                                self._read_reg_single(reg_type, r_payloads, data)
+                        continue
+
+                # 3) Fallback: isolate by reading each entity individually
+                self._read_reg_single(reg_type, payloads, data)
+
+        # ----------- batch coils/discrete bits -----------
+        for reg_type, groups in self._bit_plan.items():
+            for start, end, payloads in groups:
                 count = end - start + 1
 
                 rr = None
                 batch_ok = False
                 try:
                     if reg_type == "coil":
-                        rr = await self.hass.async_add_executor_job(
-                            self.client.read_coils, start, count, self._slave
-                        )
+                        rr = self.client.read_coils(start, count, self._slave)
                     else:
-                        rr = await self.hass.async_add_executor_job(
-                            self.client.read_discrete_inputs, start, count, self._slave
-                        )
+                        rr = self.client.read_discrete_inputs(start, count, self._slave)
 
                     if _rr_is_error(rr):
                         raise RuntimeError(f"Modbus error response: {rr}")
                     batch_ok = True
 
+                except _TRANSPORT_ERRORS:
+                    raise
                 except Exception as ex:
                     _LOGGER.warning(
                         "Batch read failed (%s %d..%d, count=%d, slave=%d): %s",
@@ -472,41 +974,37 @@ class ModbusMappedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     )
 
                 if batch_ok and rr is not None:
+                    if self._bad_reads:
+                        for p in payloads:
+                            self._bad_reads.pop((reg_type, p.addr), None)
                     bits = rr.bits
-                    for (ent, addr) in payloads:
+                    for key, addr, ent in payloads:
                         off = addr - start
                         try:
-                            data[ent.key] = bool(bits[off])
+                            data[key] = bool(bits[off])
                         except Exception as ex:
-                            data[ent.key] = None
+                            data[key] = None
                             _LOGGER.warning(
                                 "Decode failed for %s (key=%s, %s addr=%d): %s",
-                                ent.platform, ent.key, reg_type, addr, ex
+                                ent.platform, key, reg_type, addr, ex
                             )
                     continue
 
                 # fallback: per-bit read
-                for (ent, addr) in payloads:
+                for key, addr, ent in payloads:
+                    rr1 = self._read_fallback(reg_type, addr, 1)
                     try:
-                        if reg_type == "coil":
-                            rr1 = await self.hass.async_add_executor_job(
-                                self.client.read_coils, addr, 1, self._slave
-                            )
-                        else:
-                            rr1 = await self.hass.async_add_executor_job(
-                                self.client.read_discrete_inputs, addr, 1, self._slave
-                            )
-
-                        if _rr_is_error(rr1):
-                            raise RuntimeError(f"Modbus error response: {rr1}")
-
-                        data[ent.key] = bool(rr1.bits[0])
+                        if isinstance(rr1, Exception):
+                            raise rr1
+                        data[key] = bool(rr1.bits[0])
+                    except _SkippedRead:
+                        data[key] = None
                     except Exception as ex:
-                        data[ent.key] = None
+                        data[key] = None
                         _LOGGER.error(
                             "Read failed for %s (key=%s, %s addr=%d slave=%d). "
                             "Entity will be set to None. Error: %s",
-                            ent.platform, ent.key, reg_type, addr, self._slave, ex
+                            ent.platform, key, reg_type, addr, self._slave, ex
                         )
 
         return data
@@ -537,54 +1035,98 @@ class ModbusMappedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         await self.write_holding(dummy, value)
 
     async def write_holding(self, ent: MappedEntity, value) -> None:
-        w = ent.write
-        if not w:
+        if not ent.write:
             return
 
-        w_type = str(w.get("type", "holding"))
-        if w_type != "holding":
-            raise UpdateFailed(f"write.type '{w_type}' wird derzeit nicht unterstützt")
-
-        addr = int(w["address"])
-        refresh_needed = False
+        spec = self._write_specs.get(ent.key)
+        if spec is None:
+            spec = _make_write_spec(ent)
+        addr = spec.addr
+        written = False
+
+        async with self._write_lock:
+            # Checked under the lock, so an earlier write of another value has completed by now
+            # and is accounted for in _last_write_at.
+            ok_at = self._data_ok_at
+            if (
+                spec.skip_unchanged
+                and ok_at is not None
+                and ok_at > self._last_write_at
+                and time.monotonic() - ok_at < UNCHANGED_MAX_AGE
+                and self.data
+                and _is_unchanged(spec, ent, self.data.get(ent.key), value)
+            ):
+                # e.g. a slider released on its current value: nothing to send
+                _LOGGER.debug("Skipping write of unchanged value %s to %s", value, ent.key)
+                return
 
-        async with self._lock:
             last: Exception | None = None
             for _ in range(2):
                 try:
-                    await self._ensure()
+                    await self._ensure(write=True)
 
-                    if "bit" in w:
-                        bit = int(w["bit"])
-                        rr = await self.hass.async_add_executor_job(
-                            self.client.read_holding_registers, addr, 1, self._slave
-                        )
-                        cur = int(rr.registers[0]) & 0xFFFF
-                        if bool(value):
-                            cur |= (1 << bit)
+                    if spec.mask is not None:
+                        shadow = self._reg_shadow.pop(addr, None)
+                        if shadow is not None and time.monotonic() - shadow[1] < SHADOW_MAX_AGE:
+                            # just polled (or written): skip the read half of the read-modify-write
+                            cur = shadow[0]
                         else:
-                            cur &= ~(1 << bit)
-                        await self.hass.async_add_executor_job(
-                            self.client.write_register, addr, cur, self._slave
+                            rr = await self._submit(
+                                self.client.read_holding_registers, addr, 1, self._slave, write=True
+                            )
+                            if _rr_is_error(rr):
+                                raise _ModbusErrorResponse(rr)
+                            cur = rr.registers[0]
+                        cur = ((cur | spec.mask) if value else (cur & ~spec.mask)) & 0xFFFF
+                        wr = await self._submit(
+                            self.client.write_register, addr, cur, self._slave, write=True
                         )
                     else:
-                        scale = w.get("scale")
-                        v = value
-                        if scale is not None and float(scale) != 0.0:
-                            v = float(value) / float(scale)
-
-                        await self.hass.async_add_executor_job(
-                            self.client.write_register, addr, int(v), self._slave
-                        )
+                        v = value if spec.scale is None else float(value) / spec.scale
+                        words = _encode_registers(spec.dtype, spec.word_order, v)
+                        if len(words) == 1:
+                            wr = await self._submit(
+                                self.client.write_register, addr, words[0], self._slave, write=True
+                            )
+                        else:
+                            wr = await self._submit(
+                                self.client.write_registers, addr, words, self._slave, write=True
+                            )
 
-                    refresh_needed = True
+                    if _rr_is_error(wr):
+                        # the device answered: no point reconnecting, and nothing to show optimistically
+                        raise _ModbusErrorResponse(wr)
+                    if spec.mask is not None:
+                        self._reg_shadow[addr] = (cur, time.monotonic())
+                    elif self._reg_shadow:
+                        # the whole word(s) changed: a later bit write must not rebuild from the old value
+                        for a in range(addr, addr + len(words)):
+                            self._reg_shadow.pop(a, None)
+                    shown = bool(value) if spec.mask is not None else _make_decoder(
+                        spec.dtype, spec.word_order, spec.scale, None
+                    )(words, 0)
+                    written = True
                     break
 
+                except _TRANSPORT_ERRORS as ex:
+                    # link is gone: reconnect once and retry
+                    last = ex
+                    await self._drop(write=True)
                 except Exception as ex:
                     last = ex
-                    await self._drop()
+                    break
 
-            if not refresh_needed:
+            if not written:
                 raise UpdateFailed(str(last) if last else "Write failed")
-
-        self.hass.async_create_task(self.async_request_refresh())
+            self._write_gen += 1
+            self._written_gen[ent.key] = self._write_gen
+            self._last_write_at = time.monotonic()
+
+        if spec.optimistic and not spec.verify and self.data and ent.key in self.data:
+            # optimistic: show what the device now holds (after scaling/rounding), the next poll confirms it
+            new_data = dict(self.data)
+            new_data[ent.key] = shown
+            self.async_set_updated_data(new_data)
+        else:
+            # verify, or the read shows something else than what was written: read the device back
+            self._request_readback()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import ModbusMappedCoordinator
+
+
+def _as_bool(v: Any) -> bool | None:
+    # coils/bits arrive as bool, registers as int: a compare covers both
+    return None if v is None else v != 0
+
+
+class MappedValueEntity(CoordinatorEntity[ModbusMappedCoordinator]):
+    """Entity showing one polled value; platforms map it onto their _attr_* in _apply()."""
+
+    # HA entity bases still carry a __dict__ (for the _attr_* fields); slots only
+    # cover the attributes added here.
+    __slots__ = ("_key", "_last_state")
+
+    def __init__(self, coordinator: ModbusMappedCoordinator, key: str) -> None:
+        super().__init__(coordinator)
+        self._key = key
+        self._last_state: tuple[bool, Any] | None = None
+
+    def _apply(self, v: Any) -> None:
+        raise NotImplementedError
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Most values repeat poll after poll (setpoints, modes, temperatures at rest):
+        # only write state when the value or availability changed.
+        v = self.coordinator.data.get(self._key)
+        state = (self.available, v)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self._apply(v)
+        self.async_write_ha_state()
@@ -2,13 +2,19 @@ from __future__ import annotations
 
 import inspect
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
 from pymodbus.client import ModbusSerialClient, ModbusTcpClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# One wrapper per physical endpoint, shared by all config entries that talk to it
+# (several slaves behind one TCP gateway, or on one serial bus).
+_POOL: dict[tuple, "ModbusClientWrapper"] = {}
+
 @dataclass(frozen=True)
 class TcpParams:
     host: str
@@ -22,6 +28,58 @@ class RtuParams:
     parity: str
     stopbits: int
 
+def _not_connected(*args: Any) -> Any:
+    raise RuntimeError("Client not connected")
+
+
+def _bind_slave_call(fn: Any, fn_name: str, counted: bool) -> Callable[[int, Any, int], Any]:
+    """
+    Returns call(address, count_or_value, slave) for a pymodbus client method,
+    with the slave keyword of this pymodbus version baked in:
+      - fn(..., device_id=1)   (new, keyword-only)
+      - fn(..., slave=1)       (old)
+      - fn(..., unit=1)        (older)
+    Reads take count as keyword, writes take the value positionally.
+    """
+    try:
+        params = inspect.signature(fn).parameters
+    except Exception:
+        params = None
+
+    if params is not None:
+        if counted:
+            if "device_id" in params:
+                return lambda address, count, slave: fn(address, count=count, device_id=slave)
+            if "slave" in params:
+                return lambda address, count, slave: fn(address, count=count, slave=slave)
+            if "unit" in params:
+                return lambda address, count, slave: fn(address, count=count, unit=slave)
+        else:
+            if "device_id" in params:
+                return lambda address, value, slave: fn(address, value, device_id=slave)
+            if "slave" in params:
+                return lambda address, value, slave: fn(address, value, slave=slave)
+            if "unit" in params:
+                return lambda address, value, slave: fn(address, value, unit=slave)
+
+    def fallback(address: int, arg: Any, slave: int) -> Any:
+        args, kwargs = ((address,), {"count": arg}) if counted else ((address, arg), {})
+        if params is None:
+            # If signature is not available, try common order:
+            # historically: (address, count=..., slave=...)
+            try:
+                return fn(*args, slave=slave, **kwargs)
+            except TypeError:
+                return fn(*args, unit=slave, **kwargs)
+        # last resort: maybe accepts 3rd positional
+        try:
+            return fn(*args, slave, **kwargs)
+        except TypeError as ex:
+            raise TypeError(f"{fn_name}() does not accept slave/device_id/unit parameter") from ex
+
+    return fallback
+
+
 class ModbusClientWrapper:
     """
     Thin wrapper around pymodbus sync client.
@@ -30,7 +88,7 @@ class ModbusClientWrapper:
     PyModbus changed the parameter name for addressing a slave/device:
       - old: slave=...
       - new: device_id=... (keyword-only)
-    We adapt at runtime by inspecting the called method signature.
+    We adapt by inspecting each method signature once, when the client is created.
     """
 
     def __init__(self, transport: str, tcp: TcpParams | None, rtu: RtuParams | None) -> None:
@@ -38,8 +96,65 @@ class ModbusClientWrapper:
         self._tcp = tcp
         self._rtu = rtu
         self._client: ModbusTcpClient | ModbusSerialClient | None = None
+        # Polls and writes (of every entry sharing this wrapper) run in different executor jobs; this keeps their
+        # request/response pairs from interleaving on the wire.
+        self._io_lock = threading.Lock()
+        # Own worker threads for every blocking call, instead of competing with the rest of HA
+        # for the shared executor. Two workers, so the polls of two entries sharing this wrapper
+        # don't queue behind each other.
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="modbus_mapped_device")
+        # Writes get a worker of their own: however many entries are polling, a write can
+        # always go out between their requests.
+        self.write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="modbus_mapped_device_write")
+        self._refs = 0
+        # Per-method callables with the slave keyword baked in; bound once the client exists
+        self._read_holding = self._read_input = self._read_coils = self._read_discrete = _not_connected
+        self._write_register = self._write_registers = self._write_coil = _not_connected
+
+    @staticmethod
+    def _pool_key(transport: str, tcp: TcpParams | None, rtu: RtuParams | None) -> tuple:
+        if transport == "tcp":
+            assert tcp is not None
+            return (transport, tcp.host, tcp.port)
+        assert rtu is not None
+        # A serial port can only be opened once, whatever the line settings
+        return (transport, rtu.port)
+
+    @classmethod
+    def acquire(cls, transport: str, tcp: TcpParams | None, rtu: RtuParams | None) -> ModbusClientWrapper:
+        """Returns the shared wrapper for this endpoint, creating it on first use."""
+        key = cls._pool_key(transport, tcp, rtu)
+        wrapper = _POOL.get(key)
+        if wrapper is None:
+            wrapper = _POOL[key] = cls(transport, tcp, rtu)
+        elif rtu is not None and wrapper._rtu != rtu:
+            _LOGGER.warning(
+                "Serial port %s is already in use with different settings (%s); sharing the existing connection",
+                rtu.port, wrapper._rtu,
+            )
+        wrapper._refs += 1
+        return wrapper
+
+    @property
+    def shared(self) -> bool:
+        """True while more than one config entry uses this wrapper."""
+        return self._refs > 1
+
+    def release(self) -> bool:
+        """Drops one user; True if it was the last one and the caller must close() and shutdown()."""
+        self._refs -= 1
+        if self._refs > 0:
+            return False
+        key = self._pool_key(self._transport, self._tcp, self._rtu)
+        if _POOL.get(key) is self:
+            del _POOL[key]
+        return True
 
     def connect(self) -> bool:
+        with self._io_lock:
+            return self._connect()
+
+    def _connect(self) -> bool:
         if self._client is None:
             if self._transport == "tcp":
                 assert self._tcp is not None
@@ -59,6 +174,7 @@ class ModbusClientWrapper:
                     stopbits=self._rtu.stopbits,
                     timeout=2,
                 )
+            self._bind_calls()
 
         try:
             _LOGGER.debug("Connecting to Modbus client...")
@@ -72,82 +188,73 @@ class ModbusClientWrapper:
             _LOGGER.error("Modbus connect failed: %s", ex, exc_info=True)
             return False
 
+    @property
+    def connected(self) -> bool:
+        """Cheap check (no I/O) whether the underlying socket/port is still open."""
+        if self._client is None:
+            return False
+        # pymodbus exposes .connected on its sync clients; assume open if a version lacks it
+        return bool(getattr(self._client, "connected", True))
+
     def close(self) -> None:
         if self._client is None:
             return
         try:
             _LOGGER.debug("Closing Modbus connection...")
-            self._client.close()
+            with self._io_lock:
+                self._client.close()
             _LOGGER.debug("Modbus connection closed successfully.")
         except Exception as ex:
             _LOGGER.error("Failed to close Modbus connection: %s", ex, exc_info=True)
 
-    # ---------- compatibility helper ----------
-
-    def _call_with_slave_compat(self, fn_name: str, *args: Any, slave: int, **kwargs: Any) -> Any:
-        """
-        Call a pymodbus ModbusClientMixin method in a way that works with both:
-          - fn(..., slave=1)
-          - fn(..., device_id=1)   (keyword-only)
-        and as a fallback also supports older unit= naming.
-        """
-        if self._client is None:
-            raise RuntimeError("Client not connected")
-
-        fn = getattr(self._client, fn_name)
-
-        try:
-            sig = inspect.signature(fn)
-            params = sig.parameters
-        except Exception:
-            # If signature is not available, try common order:
-            # historically: (address, count=..., slave=...)
-            try:
-                return fn(*args, slave=slave, **kwargs)
-            except TypeError:
-                return fn(*args, unit=slave, **kwargs)
-
-        if "device_id" in params:
-            # new pymodbus: keyword-only device_id
-            return fn(*args, device_id=slave, **kwargs)
-        if "slave" in params:
-            # old pymodbus: slave kw
-            return fn(*args, slave=slave, **kwargs)
-        if "unit" in params:
-            # some older variants used unit
-            return fn(*args, unit=slave, **kwargs)
+    def shutdown(self) -> None:
+        """Releases the worker threads; call after close()."""
+        self.executor.shutdown(wait=False)
+        self.write_executor.shutdown(wait=False)
 
-        # last resort: maybe accepts 3rd positional
-        try:
-            return fn(*args, slave, **kwargs)
-        except TypeError as ex:
-            raise TypeError(f"{fn_name}() does not accept slave/device_id/unit parameter") from ex
+    def _bind_calls(self) -> None:
+        c = self._client
+        self._read_holding = _bind_slave_call(c.read_holding_registers, "read_holding_registers", counted=True)
+        self._read_input = _bind_slave_call(c.read_input_registers, "read_input_registers", counted=True)
+        self._read_coils = _bind_slave_call(c.read_coils, "read_coils", counted=True)
+        self._read_discrete = _bind_slave_call(c.read_discrete_inputs, "read_discrete_inputs", counted=True)
+        self._write_register = _bind_slave_call(c.write_register, "write_register", counted=False)
+        self._write_registers = _bind_slave_call(c.write_registers, "write_registers", counted=False)
+        self._write_coil = _bind_slave_call(c.write_coil, "write_coil", counted=False)
 
     # ---------- read helpers ----------
+    # Arguments are passed through as-is: the coordinator converts addresses, counts,
+    # slave id and register values to int once, when the mapping/entry is loaded.
 
     def read_holding_registers(self, address: int, count: int, slave: int):
-        _LOGGER.debug("Reading holding registers: address=%d, count=%d, slave=%d", address, count, slave)
-        return self._call_with_slave_compat("read_holding_registers", int(address), count=int(count), slave=int(slave))
+        with self._io_lock:
+            return self._read_holding(address, count, slave)
 
     def read_input_registers(self, address: int, count: int, slave: int):
-        _LOGGER.debug("Reading input registers: address=%d, count=%d, slave=%d", address, count, slave)
-        return self._call_with_slave_compat("read_input_registers", int(address), count=int(count), slave=int(slave))
+        with self._io_lock:
+            return self._read_input(address, count, slave)
 
     def read_coils(self, address: int, count: int, slave: int):
-        _LOGGER.debug("Reading coils: address=%d, count=%d, slave=%d", address, count, slave)
-        return self._call_with_slave_compat("read_coils", int(address), count=int(count), slave=int(slave))
+        with self._io_lock:
+            return self._read_coils(address, count, slave)
 
     def read_discrete_inputs(self, address: int, count: int, slave: int):
-        _LOGGER.debug("Reading discrete inputs: address=%d, count=%d, slave=%d", address, count, slave)
-        return self._call_with_slave_compat("read_discrete_inputs", int(address), count=int(count), slave=int(slave))
+        with self._io_lock:
+            return self._read_discrete(address, count, slave)
 
     # ---------- write helpers ----------
 
     def write_register(self, address: int, value: int, slave: int):
         _LOGGER.debug("Writing to register: address=%d, value=%d, slave=%d", address, value, slave)
-        # pymodbus API name is "write_register"
-        return self._call_with_slave_compat("write_register", int(address), int(value), slave=int(slave))
+        with self._io_lock:
+            return self._write_register(address, value, slave)
+
+    def write_registers(self, address: int, values: list[int], slave: int):
+        _LOGGER.debug("Writing to registers: address=%d, values=%s, slave=%d", address, values, slave)
+        with self._io_lock:
+            return self._write_registers(address, values, slave)
 
     def write_coil(self, address: int, value: bool, slave: int):
         _LOGGER.debug("Writing to coil: address=%d, value=%s, slave=%d", address, value, slave)
-        return self._call_with_slave_compat("write_coil", int(address), bool(value), slave=int(slave))
+        with self._io_lock:
+            return self._write_coil(address, value, slave)
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import PLATFORM_SELECT
 from .coordinator import ModbusMappedCoordinator, MappedEntity
+from .entity import MappedValueEntity
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
-    coordinator: ModbusMappedCoordinator = hass.data[DOMAIN][entry.entry_id]
-    ents = [e for e in coordinator.mapping.entities if e.platform == "select"]
+    coordinator: ModbusMappedCoordinator = entry.runtime_data
+    ents = coordinator.entities_by_platform.get(PLATFORM_SELECT, ())
     async_add_entities([MappedSelect(coordinator, entry, e) for e in ents])
 
 
@@ -26,23 +28,21 @@ def _normalize_options(raw) -> list[tuple[str, int]]:
     out: list[tuple[str, int]] = []
     if not raw:
         return out
-    
+    app = out.append
     # Handle dict format (from YAML: {0: "Self-Use", 1: "Economical Mode", ...})
     if isinstance(raw, dict):
         for key, label in raw.items():
             try:
                 # Convert key to int (it might be parsed as string)
                 value = int(key)
-                # Ensure label is string
-                label_str = str(label) if not isinstance(label, str) else label
-                out.append((label_str, value))
             except (ValueError, TypeError):
                 # Skip invalid entries
-                pass
+                continue
+            app((label if isinstance(label, str) else str(label), value))
         # Sort by value for consistent ordering
         out.sort(key=lambda x: x[1])
         return out
-    
+
     # Handle list format
     if isinstance(raw, list):
         for idx, item in enumerate(raw):
@@ -50,15 +50,17 @@ def _normalize_options(raw) -> list[tuple[str, int]]:
                 label = item.get("label")
                 value = item.get("value")
                 if isinstance(label, str) and isinstance(value, int):
-                    out.append((label, value))
+                    app((label, value))
             elif isinstance(item, str):
-                out.append((item, idx))
-    
+                app((item, idx))
+
     return out
 
-class MappedSelect(CoordinatorEntity[ModbusMappedCoordinator], SelectEntity):
+class MappedSelect(MappedValueEntity, SelectEntity):
+    __slots__ = ("_entry", "_ent", "_display_to_value", "_value_to_display")
+
     def __init__(self, coordinator: ModbusMappedCoordinator, entry: ConfigEntry, ent: MappedEntity) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, ent.key)
 
         self._entry = entry
         self._ent = ent
@@ -66,15 +68,15 @@ class MappedSelect(CoordinatorEntity[ModbusMappedCoordinator], SelectEntity):
         self._attr_unique_id = f"{entry.entry_id}:{ent.key}"
         self._attr_name = ent.name
 
-        icon = getattr(ent, "icon", None)
+        icon = ent.icon
         if icon:
             self._attr_icon = icon
 
-        description = getattr(ent, "description", None)
+        description = ent.description
         if description:
             self._attr_entity_description = description
 
-        self._pairs = _normalize_options(getattr(ent, "options", None))
+        pairs = _normalize_options(ent.options)
 
         # UI: show values by embedding them into displayed label
         # displayed -> value
@@ -82,7 +84,7 @@ class MappedSelect(CoordinatorEntity[ModbusMappedCoordinator], SelectEntity):
         # value -> displayed
         self._value_to_display: dict[int, str] = {}
 
-        for label, value in self._pairs:
+        for label, value in pairs:
             disp = f"{label} ({value})"
             # handle duplicates gracefully
             if disp in self._display_to_value and self._display_to_value[disp] != value:
@@ -94,15 +96,16 @@ class MappedSelect(CoordinatorEntity[ModbusMappedCoordinator], SelectEntity):
 
         # Helpful debug attributes (so you can inspect the mapping in HA UI)
         self._attr_extra_state_attributes = {
-            "key": ent.key,
-            "enum_map": {label: value for (label, value) in self._pairs},
+            **ent.attributes,
+            "enum_map": {label: value for (label, value) in pairs},
         }
-        if description:
-            self._attr_extra_state_attributes["description"] = description
 
-    @property
-    def current_option(self) -> str | None:
-        v = self.coordinator.data.get(self._ent.key)
+        self._apply(coordinator.data.get(self._key))
+
+    def _apply(self, v: Any) -> None:
+        self._attr_current_option = self._option_for(v)
+
+    def _option_for(self, v: Any) -> str | None:
         if v is None:
             return None
         try:
@@ -115,10 +118,10 @@ class MappedSelect(CoordinatorEntity[ModbusMappedCoordinator], SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         # displayed label -> value
-        if option not in self._display_to_value:
+        val = self._display_to_value.get(option)
+        if val is None:
             return
-        val = self._display_to_value[option]
 
         # Requires write section
-        if getattr(self._ent, "write", None):
+        if self._ent.write:
             await self.coordinator.write_holding(self._ent, val)
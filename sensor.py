@@ -5,45 +5,23 @@ from typing import Any
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import PLATFORM_SENSOR
 from .coordinator import ModbusMappedCoordinator, MappedEntity
+from .entity import MappedValueEntity
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
-    coordinator: ModbusMappedCoordinator = hass.data[DOMAIN][entry.entry_id]
-    ents = [e for e in coordinator.mapping.entities if e.platform == "sensor"]
+    coordinator: ModbusMappedCoordinator = entry.runtime_data
+    ents = coordinator.entities_by_platform.get(PLATFORM_SENSOR, ())
     async_add_entities([MappedSensor(coordinator, entry, e) for e in ents])
 
 
-def _get_min(ent: MappedEntity) -> float | None:
-    v = getattr(ent, "minimum", None)
-    if v is None:
-        v = getattr(ent, "min", None)
-    if v is None:
-        return None
-    try:
-        return float(v)
-    except Exception:
-        return None
+class MappedSensor(MappedValueEntity, SensorEntity):
+    __slots__ = ("_entry", "_ent")
 
-
-def _get_max(ent: MappedEntity) -> float | None:
-    v = getattr(ent, "maximum", None)
-    if v is None:
-        v = getattr(ent, "max", None)
-    if v is None:
-        return None
-    try:
-        return float(v)
-    except Exception:
-        return None
-
-
-class MappedSensor(CoordinatorEntity[ModbusMappedCoordinator], SensorEntity):
     def __init__(self, coordinator: ModbusMappedCoordinator, entry: ConfigEntry, ent: MappedEntity) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, ent.key)
 
         self._entry = entry
         self._ent = ent
@@ -51,39 +29,30 @@ class MappedSensor(CoordinatorEntity[ModbusMappedCoordinator], SensorEntity):
         self._attr_unique_id = f"{entry.entry_id}:{ent.key}"
         self._attr_name = ent.name
 
-        unit = getattr(ent, "unit", None)
+        unit = ent.unit
         if unit:
             self._attr_native_unit_of_measurement = unit
 
-        icon = getattr(ent, "icon", None)
+        icon = ent.icon
         if icon:
             self._attr_icon = icon
 
-        device_class = getattr(ent, "device_class", None)
+        device_class = ent.device_class
         if device_class:
             self._attr_device_class = device_class
 
-        state_class = getattr(ent, "state_class", None)
+        state_class = ent.state_class
         if state_class:
             self._attr_state_class = state_class
 
-        description = getattr(ent, "description", None)
+        description = ent.description
         if description:
             self._attr_entity_description = description
 
-        # Useful metadata as attributes (optional)
-        self._attr_extra_state_attributes = {
-            "key": ent.key,
-        }
-        mn = _get_min(ent)
-        mx = _get_max(ent)
-        if mn is not None:
-            self._attr_extra_state_attributes["minimum"] = mn
-        if mx is not None:
-            self._attr_extra_state_attributes["maximum"] = mx
-        if description:
-            self._attr_extra_state_attributes["description"] = description
+        # Useful metadata as attributes (key, minimum/maximum, description), built at mapping load
+        self._attr_extra_state_attributes = ent.attributes
+
+        self._apply(coordinator.data.get(self._key))
 
-    @property
-    def native_value(self) -> Any:
-        return self.coordinator.data.get(self._ent.key)
+    def _apply(self, v: Any) -> None:
+        self._attr_native_value = v
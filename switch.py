@@ -1,23 +1,27 @@
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import PLATFORM_SWITCH
 from .coordinator import ModbusMappedCoordinator, MappedEntity
+from .entity import MappedValueEntity, _as_bool
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
-    coordinator: ModbusMappedCoordinator = hass.data[DOMAIN][entry.entry_id]
-    ents = [e for e in coordinator.mapping.entities if e.platform == "switch"]
+    coordinator: ModbusMappedCoordinator = entry.runtime_data
+    ents = coordinator.entities_by_platform.get(PLATFORM_SWITCH, ())
     async_add_entities([MappedSwitch(coordinator, entry, e) for e in ents])
 
 
-class MappedSwitch(CoordinatorEntity[ModbusMappedCoordinator], SwitchEntity):
+class MappedSwitch(MappedValueEntity, SwitchEntity):
+    __slots__ = ("_entry", "_ent")
+
     def __init__(self, coordinator: ModbusMappedCoordinator, entry: ConfigEntry, ent: MappedEntity) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, ent.key)
 
         self._entry = entry
         self._ent = ent
@@ -25,24 +29,20 @@ class MappedSwitch(CoordinatorEntity[ModbusMappedCoordinator], SwitchEntity):
         self._attr_unique_id = f"{entry.entry_id}:{ent.key}"
         self._attr_name = ent.name
 
-        icon = getattr(ent, "icon", None)
+        icon = ent.icon
         if icon:
             self._attr_icon = icon
 
-        description = getattr(ent, "description", None)
+        description = ent.description
         if description:
             self._attr_entity_description = description
 
-        self._attr_extra_state_attributes = {"key": ent.key}
-        if description:
-            self._attr_extra_state_attributes["description"] = description
+        self._attr_extra_state_attributes = ent.attributes
+
+        self._apply(coordinator.data.get(self._key))
 
-    @property
-    def is_on(self) -> bool | None:
-        v = self.coordinator.data.get(self._ent.key)
-        if v is None:
-            return None
-        return bool(v)
+    def _apply(self, v: Any) -> None:
+        self._attr_is_on = _as_bool(v)
 
     async def async_turn_on(self, **kwargs) -> None:
         await self._write(True)
@@ -52,7 +52,7 @@ class MappedSwitch(CoordinatorEntity[ModbusMappedCoordinator], SwitchEntity):
 
     async def _write(self, value: bool) -> None:
         # Prefer entity-based write (holding-bit-switch etc.)
-        if getattr(self._ent, "write", None):
+        if self._ent.write:
             await self.coordinator.write_holding(self._ent, value)
             return
 